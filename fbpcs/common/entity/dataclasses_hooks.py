@@ -7,7 +7,17 @@
 from abc import abstractmethod
 from dataclasses import dataclass
 from enum import auto, Enum
-from typing import Any, ClassVar, Dict, Generic, Iterable, List, Optional, TypeVar
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 
 class HookEventType(Enum):
@@ -43,6 +53,11 @@ class DataclassHook(Generic[T]):
 @dataclass
 class DataclassHookMixin:
     HOOK_METADATA_STR: ClassVar[str] = "DataclassHook_metadata_str"
+    # hooks resolved by _get_hooks, keyed by (field name, event type).
+    # Stored on each concrete class, since subclasses can declare different fields.
+    _resolved_hooks: ClassVar[
+        Dict[Tuple[str, HookEventType], Tuple[DataclassHook, ...]]
+    ]
 
     def __setattr__(self, name: str, value: Any) -> None:
         old_value = getattr(self, name, None)
@@ -77,6 +92,19 @@ class DataclassHookMixin:
         hook_type: HookEventType,
         field_name: str,
     ) -> Iterable[DataclassHook]:
+        # field metadata is fixed once the dataclass is created, so resolve each
+        # (field, event) combination once per class and reuse the resulting tuple
+        cls = type(self)
+        resolved_hooks_cache = cls.__dict__.get("_resolved_hooks")
+        if resolved_hooks_cache is None:
+            resolved_hooks_cache = {}
+            cls._resolved_hooks = resolved_hooks_cache
+
+        cache_key = (field_name, hook_type)
+        cached_hooks = resolved_hooks_cache.get(cache_key)
+        if cached_hooks is not None:
+            return cached_hooks
+
         hooks: List[DataclassHook] = []
         # pyre-fixme Undefined attribute [16]: DataclassHookMixin has no attribute __dataclass_fields__
         hook_pool: Iterable[DataclassHook] = self.__dataclass_fields__[
@@ -87,7 +115,10 @@ class DataclassHookMixin:
                 triggers: Iterable[HookEventType] = h.triggers
                 if hook_type in triggers:
                     hooks.append(h)
-        return hooks
+
+        resolved_hooks = tuple(hooks)
+        resolved_hooks_cache[cache_key] = resolved_hooks
+        return resolved_hooks
 
     def _run_hooks(
         self,
@@ -96,8 +127,7 @@ class DataclassHookMixin:
         previous_field_value: Optional[Any] = None,
         new_field_value: Optional[Any] = None,
     ) -> None:
-        hooks: Iterable[DataclassHook] = self._get_hooks(hook_type, field_name)
-        for hook in hooks:
+        for hook in self._get_hooks(hook_type, field_name):
             hook.run(self, field_name, previous_field_value, new_field_value, hook_type)
 
     @staticmethod
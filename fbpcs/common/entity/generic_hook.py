@@ -25,7 +25,8 @@ class GenericHook(DataclassHook[T]):
         hook_condition: Optional[Callable[[T], bool]] = None,
     ) -> None:
         self.hook_function = hook_function
-        self.hook_condition: Callable[[T], bool] = hook_condition or (lambda _: True)
+        # None means always run, and skips the extra condition call on every event
+        self.hook_condition: Optional[Callable[[T], bool]] = hook_condition
         self._triggers = triggers
 
     def run(
@@ -39,7 +40,7 @@ class GenericHook(DataclassHook[T]):
         hook_event: HookEventType,
     ) -> None:
         # if certain condition meets, we call some operations on instance
-        if self.hook_condition(instance):
+        if self.hook_condition is None or self.hook_condition(instance):
             self.hook_function(instance)
 
     @property
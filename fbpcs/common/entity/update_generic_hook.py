@@ -20,7 +20,8 @@ class UpdateGenericHook(DataclassHook[T]):
         triggers: Optional[Iterable[HookEventType]] = None,
     ) -> None:
         self.update_function = update_function
-        self.update_condition = update_condition or (lambda _: True)
+        # None means always run, and skips the extra condition call on every event
+        self.update_condition = update_condition
         self.only_trigger_on_change = only_trigger_on_change
         self._triggers = triggers or [
             HookEventType.POST_INIT,
@@ -37,7 +38,7 @@ class UpdateGenericHook(DataclassHook[T]):
     ) -> None:
         if (
             previous_field_value != new_field_value or not self.only_trigger_on_change
-        ) and self.update_condition(instance):
+        ) and (self.update_condition is None or self.update_condition(instance)):
             self.update_function(instance)
 
     @property
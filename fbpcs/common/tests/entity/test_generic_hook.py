@@ -35,6 +35,18 @@ highest_pressure_hook: GenericHook[InstanceBase] = GenericHook(
 )
 
 
+# count every pressure update, no condition
+def count_pressure_updates(obj: InstanceBase) -> None:
+    # pyre-ignore Undefined attribute [16]: `InstanceBase` has no attribute `pressure_updates`
+    obj.pressure_updates += 1
+
+
+pressure_updates_hook: GenericHook[InstanceBase] = GenericHook(
+    count_pressure_updates,
+    [HookEventType.POST_UPDATE],
+)
+
+
 @dataclass
 class DummyInstance(InstanceBase):
     """
@@ -49,10 +61,13 @@ class DummyInstance(InstanceBase):
     output_path: str
 
     pressure: int = field(
-        metadata=DataclassHookMixin.get_metadata(highest_pressure_hook),
+        metadata=DataclassHookMixin.get_metadata(
+            highest_pressure_hook, pressure_updates_hook
+        ),
     )
 
     highest_pressure: int = field(init=False)
+    pressure_updates: int = field(default=0, init=False)
 
     def get_instance_id(self) -> str:
         return self.instance_id
@@ -71,3 +86,27 @@ class TestFrozenFieldHook(unittest.TestCase):
         self.assertEqual(dummy_obj.highest_pressure, 70)
         dummy_obj.pressure = 50
         self.assertEqual(dummy_obj.highest_pressure, 70)
+
+    def test_generic_hook_without_condition(self) -> None:
+        dummy_obj = DummyInstance(
+            "01", "Tupper01", "//fbsource", "//fbsource:output", 25
+        )
+        self.assertEqual(dummy_obj.pressure_updates, 0)
+
+        dummy_obj.pressure = 70
+        dummy_obj.pressure = 50
+        self.assertEqual(dummy_obj.pressure_updates, 2)
+
+    def test_resolved_hooks_cached_per_class(self) -> None:
+        dummy_obj = DummyInstance(
+            "01", "Tupper01", "//fbsource", "//fbsource:output", 25
+        )
+        dummy_obj.pressure = 70
+
+        self.assertEqual(
+            DummyInstance.__dict__["_resolved_hooks"][
+                ("pressure", HookEventType.POST_UPDATE)
+            ],
+            (highest_pressure_hook, pressure_updates_hook),
+        )
+        self.assertNotIn("_resolved_hooks", DataclassHookMixin.__dict__)
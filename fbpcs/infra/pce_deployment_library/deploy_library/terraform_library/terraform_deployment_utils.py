@@ -5,18 +5,86 @@
 
 # pyre-strict
 
-from typing import Any, Dict, List, Optional
+import functools
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 from fbpcs.infra.pce_deployment_library.deploy_library.models import (
     NOT_SUPPORTED_INIT_DEFAULT_OPTIONS,
     TerraformCliOptions,
 )
 
+# default options rejected by `terraform init`
+_INIT_EXCLUDED: FrozenSet[str] = frozenset(NOT_SUPPORTED_INIT_DEFAULT_OPTIONS)
+
+# terraform CLI accepts options with "-", using "_" will result in an error
+_UNDERSCORE_TO_DASH: Dict[int, str] = str.maketrans("_", "-")
+
+
+@functools.lru_cache(maxsize=32)
+def _split_command(command: str) -> Tuple[str, ...]:
+    """
+    Tokenizes a terraform command. Commands come from a small fixed set, so the result is cached.
+    """
+    return tuple(command.split())
+
+
+@functools.lru_cache(maxsize=None)
+def _flag(key: str) -> str:
+    """
+    Converts a python keyword argument name to its terraform CLI option name.
+    """
+    return key.translate(_UNDERSCORE_TO_DASH)
+
+
+def _format_list_option(key: str, value: List[Any]) -> List[str]:
+    # build the "-key=" prefix once instead of per element, e.g. for long resource_targets lists
+    prefix = f"-{key}="
+    return [f"{prefix}{inner_value}" for inner_value in value]
+
+
+def _format_dict_option(key: str, value: Dict[str, Any]) -> List[str]:
+    if "backend-config" in key:
+        return [f"-backend-config {k}={v}" for k, v in value.items()]
+    # TODO: read var in kwargs and update commands
+    return []
+
+
+def _format_bool_option(key: str, value: bool) -> List[str]:
+    return [f"-{key}={'true' if value else 'false'}"]
+
+
+def _format_other_option(key: str, value: Any) -> List[str]:
+    if value is None:
+        return []
+    # subclasses of list/dict miss the exact type lookup in _OPTION_FORMATTERS
+    if isinstance(value, list):
+        return _format_list_option(key, value)
+    if isinstance(value, dict):
+        return _format_dict_option(key, value)
+    return [f"-{key}={value}"]
+
+
+# dispatch on the exact option value type instead of walking an isinstance chain
+_OPTION_FORMATTERS: Dict[type, Callable[[str, Any], List[str]]] = {
+    list: _format_list_option,
+    dict: _format_dict_option,
+    bool: _format_bool_option,
+}
+
 
 class TerraformDeploymentUtils:
 
     TERRAFORM_DEFAULT_PARALLELISM = 10
 
+    __slots__ = (
+        "state_file_path",
+        "resource_targets",
+        "terraform_variables",
+        "parallelism",
+        "var_definition_file",
+        "input",
+    )
+
     def __init__(
         self,
         state_file_path: Optional[str] = None,
@@ -41,11 +109,9 @@ class TerraformDeploymentUtils:
                                  More information on var_definition_file :https://www.terraform.io/language/values/variables#variable-definitions-tfvars-files
         """
         self.state_file_path = state_file_path
-        self.resource_targets: Optional[List[str]] = (
-            [] if resource_targets is None else resource_targets
-        )
-        self.terraform_variables: Optional[Dict[str, str]] = (
-            {} if terraform_variables is None else terraform_variables
+        self.resource_targets = resource_targets if resource_targets is not None else []
+        self.terraform_variables = (
+            terraform_variables if terraform_variables is not None else {}
         )
         self.parallelism = parallelism
         self.var_definition_file = var_definition_file
@@ -62,29 +128,19 @@ class TerraformDeploymentUtils:
         Converts command string to list and updates commands with terraform options provided through kwargs and args.
         """
 
-        commands_list = command.split()
+        commands_list = list(_split_command(command))
 
-        for key, value in kwargs.items():
-            # terraform CLI accepts options with "-" using "_" will results in error
-            key = key.replace("_", "-")
-
-            if isinstance(value, list):
-                for inner_value in value:
-                    commands_list.append(f"-{key}={inner_value}")
-            elif isinstance(value, dict):
-                if "backend-config" in key:
-                    commands_list.extend(
-                        [f"-backend-config {k}={v}" for k, v in value.items()]
+        if kwargs:
+            for key, value in kwargs.items():
+                commands_list.extend(
+                    _OPTION_FORMATTERS.get(type(value), _format_other_option)(
+                        _flag(key), value
                     )
-                # TODO: read var in kwargs and update commands
-            elif isinstance(value, bool):
-                value = "true" if value else "false"
-                commands_list.append(f"-{key}={value}")
-            elif value is not None:
-                commands_list.append(f"-{key}={value}")
+                )
 
         # Add args to commands list
-        commands_list.extend(args)
+        if args:
+            commands_list.extend(args)
         return commands_list
 
     def get_default_options(
@@ -94,7 +150,7 @@ class TerraformDeploymentUtils:
         Returns the terraform configs needed to create terraform cli
         """
 
-        return_dict: Dict[str, Any] = {
+        options: Dict[str, Any] = {
             TerraformCliOptions.state: self.state_file_path,
             TerraformCliOptions.target: self.resource_targets,
             TerraformCliOptions.var: self.terraform_variables,
@@ -105,7 +161,5 @@ class TerraformDeploymentUtils:
         }
 
         if terraform_command == "init":
-            for default_option in NOT_SUPPORTED_INIT_DEFAULT_OPTIONS:
-                return_dict.pop(default_option, None)
-
-        return return_dict
+            return {k: v for k, v in options.items() if k not in _INIT_EXCLUDED}
+        return options
@@ -6,7 +6,12 @@
 # pyre-strict
 
 import unittest
+from collections import OrderedDict
 
+from fbpcs.infra.pce_deployment_library.deploy_library.models import (
+    TerraformCliOptions,
+    TerraformCommands,
+)
 from fbpcs.infra.pce_deployment_library.deploy_library.terraform_library.terraform_deployment_utils import (
     TerraformDeploymentUtils,
 )
@@ -17,9 +22,104 @@ class TestTerraformDeploymentUtils(unittest.TestCase):
         self.terraform_deployment_utils = TerraformDeploymentUtils()
 
     def test_get_default_options(self) -> None:
-        # T125643751
-        pass
+        utils = TerraformDeploymentUtils(
+            state_file_path="/tmp/state", resource_targets=["module.a"]
+        )
+        expected_apply_options = {
+            TerraformCliOptions.state: "/tmp/state",
+            TerraformCliOptions.target: ["module.a"],
+            TerraformCliOptions.var: {},
+            TerraformCliOptions.var_file: None,
+            TerraformCliOptions.parallelism: 10,
+            TerraformCliOptions.terraform_input: False,
+            "auto-approve": True,
+        }
+
+        apply_options = utils.get_default_options(
+            TerraformCommands.APPLY, {"auto-approve": True}
+        )
+        self.assertEqual(apply_options, expected_apply_options)
+
+        # default options keep their order: state, target, var, var_file, parallelism, input
+        self.assertEqual(
+            list(utils.get_default_options(TerraformCommands.APPLY, {})),
+            [
+                TerraformCliOptions.state,
+                TerraformCliOptions.target,
+                TerraformCliOptions.var,
+                TerraformCliOptions.var_file,
+                TerraformCliOptions.parallelism,
+                TerraformCliOptions.terraform_input,
+            ],
+        )
+
+        # unsupported init options are dropped
+        init_options = utils.get_default_options(
+            TerraformCommands.INIT,
+            {
+                TerraformCliOptions.backend_config: {"bucket": "test-bucket"},
+                TerraformCliOptions.state: "/tmp/other_state",
+            },
+        )
+        self.assertEqual(
+            init_options,
+            {
+                TerraformCliOptions.target: ["module.a"],
+                TerraformCliOptions.var: {},
+                TerraformCliOptions.var_file: None,
+                TerraformCliOptions.terraform_input: False,
+                TerraformCliOptions.backend_config: {"bucket": "test-bucket"},
+            },
+        )
+
+    def test_get_default_options_reads_attributes(self) -> None:
+        utils = TerraformDeploymentUtils(state_file_path="/tmp/state")
+        utils.get_default_options(TerraformCommands.APPLY, {})
+
+        utils.state_file_path = "/tmp/new_state"
+        utils.parallelism = 5
+        apply_options = utils.get_default_options(TerraformCommands.APPLY, {})
+
+        self.assertEqual(apply_options[TerraformCliOptions.state], "/tmp/new_state")
+        self.assertEqual(apply_options[TerraformCliOptions.parallelism], 5)
 
     def test_get_command_list(self) -> None:
-        # T125643785
-        pass
+        command_list = self.terraform_deployment_utils.get_command_list(
+            "terraform apply",
+            "-no-color",
+            auto_approve=True,
+            target=["module.a", "module.b"],
+            backend_config={"bucket": "test-bucket"},
+            var_file=None,
+            parallelism=10,
+        )
+        self.assertEqual(
+            command_list,
+            [
+                "terraform",
+                "apply",
+                "-auto-approve=true",
+                "-target=module.a",
+                "-target=module.b",
+                "-backend-config bucket=test-bucket",
+                "-parallelism=10",
+                "-no-color",
+            ],
+        )
+
+        # subclasses of the dispatched types are formatted like their base type
+        self.assertEqual(
+            self.terraform_deployment_utils.get_command_list(
+                "terraform init",
+                backend_config=OrderedDict([("bucket", "test-bucket")]),
+                var={"region": "us-west-2"},
+            ),
+            ["terraform", "init", "-backend-config bucket=test-bucket"],
+        )
+
+        # mutating the returned list must not leak into later calls
+        command_list.append("-lock=false")
+        self.assertEqual(
+            self.terraform_deployment_utils.get_command_list("terraform apply"),
+            ["terraform", "apply"],
+        )
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import unittest
+
+from fbpcs.pid.entity.pid_instance import PIDProtocol
+from fbpcs.pid.service.pid_service.utils import (
+    get_max_id_column_cnt,
+    get_pid_protocol_from_num_shards,
+    pid_should_use_row_numbers,
+)
+from fbpcs.private_computation.service.constants import (
+    DEFAULT_MULTIKEY_PROTOCOL_MAX_COLUMN_COUNT,
+    DEFAULT_PID_PROTOCOL,
+)
+
+
+class TestPIDUtils(unittest.TestCase):
+    def test_get_max_id_column_cnt(self) -> None:
+        self.assertEqual(
+            get_max_id_column_cnt(PIDProtocol.UNION_PID_MULTIKEY),
+            DEFAULT_MULTIKEY_PROTOCOL_MAX_COLUMN_COUNT,
+        )
+        self.assertEqual(get_max_id_column_cnt(PIDProtocol.UNION_PID), 1)
+
+    def test_get_pid_protocol_from_num_shards(self) -> None:
+        self.assertEqual(
+            get_pid_protocol_from_num_shards(1, True), PIDProtocol.UNION_PID_MULTIKEY
+        )
+        self.assertEqual(
+            get_pid_protocol_from_num_shards(1, False), DEFAULT_PID_PROTOCOL
+        )
+        self.assertEqual(
+            get_pid_protocol_from_num_shards(2, True), DEFAULT_PID_PROTOCOL
+        )
+
+    def test_pid_should_use_row_numbers(self) -> None:
+        self.assertTrue(pid_should_use_row_numbers(True, PIDProtocol.UNION_PID))
+        self.assertFalse(
+            pid_should_use_row_numbers(True, PIDProtocol.UNION_PID_MULTIKEY)
+        )
+        self.assertFalse(pid_should_use_row_numbers(False, PIDProtocol.UNION_PID))
+        self.assertFalse(
+            pid_should_use_row_numbers(False, PIDProtocol.UNION_PID_MULTIKEY)
+        )
@@ -5,31 +5,44 @@
 # LICENSE file in the root directory of this source tree.
 
 # pyre-strict
+
+import functools
+from typing import Dict, Tuple
+
 from fbpcs.pid.entity.pid_instance import PIDProtocol
 from fbpcs.private_computation.service.constants import (
     DEFAULT_MULTIKEY_PROTOCOL_MAX_COLUMN_COUNT,
     DEFAULT_PID_PROTOCOL,
 )
 
+# lookup tables built once at import so the helpers below are a single dict lookup
+_MAX_ID_COLUMN_CNT: Dict[PIDProtocol, int] = {
+    PIDProtocol.UNION_PID_MULTIKEY: DEFAULT_MULTIKEY_PROTOCOL_MAX_COLUMN_COUNT,
+}
+
+# keyed by (num_pid_containers, multikey_enabled)
+_MULTIKEY_SHARD_PROTOCOL: Dict[Tuple[int, bool], PIDProtocol] = {
+    (1, True): PIDProtocol.UNION_PID_MULTIKEY,
+}
+
 
+# the helpers below are pure functions over tiny input domains, so their caches stay bounded
+@functools.lru_cache(maxsize=None)
 def get_max_id_column_cnt(pid_protocol: PIDProtocol) -> int:
-    if pid_protocol is PIDProtocol.UNION_PID_MULTIKEY:
-        return DEFAULT_MULTIKEY_PROTOCOL_MAX_COLUMN_COUNT
-    return 1
+    return _MAX_ID_COLUMN_CNT.get(pid_protocol, 1)
 
 
+@functools.lru_cache(maxsize=None)
 def get_pid_protocol_from_num_shards(
     num_pid_containers: int, multikey_enabled: bool
 ) -> PIDProtocol:
-    if num_pid_containers == 1 and multikey_enabled:
-        return PIDProtocol.UNION_PID_MULTIKEY
-    return DEFAULT_PID_PROTOCOL
+    return _MULTIKEY_SHARD_PROTOCOL.get(
+        (num_pid_containers, bool(multikey_enabled)), DEFAULT_PID_PROTOCOL
+    )
 
 
+@functools.lru_cache(maxsize=None)
 def pid_should_use_row_numbers(
     pid_use_row_numbers: bool, pid_protocol: PIDProtocol
 ) -> bool:
-    if pid_use_row_numbers and pid_protocol is not PIDProtocol.UNION_PID_MULTIKEY:
-        return True
-    else:
-        return False
+    return pid_use_row_numbers and pid_protocol is not PIDProtocol.UNION_PID_MULTIKEY
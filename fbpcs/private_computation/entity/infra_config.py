@@ -5,9 +5,8 @@
 
 import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Optional, Set, Union
+from typing import List, Optional, Set, Tuple, Union
 
 from dataclasses_json import dataclass_json, DataClassJsonMixin
 from fbpcs.common.entity.dataclasses_hooks import DataclassHookMixin, HookEventType
@@ -40,32 +39,45 @@ class PrivateComputationGameType(Enum):
     ATTRIBUTION = "ATTRIBUTION"
 
 
+# maximum number of entries kept in InfraConfig.status_updates
+MAX_STATUS_UPDATES = 256
+
 UnionedPCInstance = Union[
     PIDInstance, PCSMPCInstance, PostProcessingInstance, StageStateInstance
 ]
 
 
 @dataclass_json
-@dataclass
+@dataclass(frozen=True)
 class StatusUpdate:
+    # one StatusUpdate is kept per status transition, so drop the per-instance __dict__
+    __slots__ = ("status", "status_update_ts")
+
     status: PrivateComputationInstanceStatus
     status_update_ts: int
 
+    # frozen and slotted: copy/pickle can't restore the slots through __setattr__
+    def __getstate__(self) -> Tuple[PrivateComputationInstanceStatus, int]:
+        return (self.status, self.status_update_ts)
 
-# called in post_status_hook
-# happens whenever status is updated
-def post_update_status(obj: "InfraConfig") -> None:
-    obj.status_update_ts = int(datetime.now(tz=timezone.utc).timestamp())
-    append_status_updates(obj)
+    def __setstate__(self, state: Tuple[PrivateComputationInstanceStatus, int]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 
 # called in post_status_hook
-def append_status_updates(obj: "InfraConfig") -> None:
-    pair: StatusUpdate = StatusUpdate(
-        obj.status,
-        obj.status_update_ts,
-    )
-    obj.status_updates.append(pair)
+# happens whenever status is updated
+def post_update_status(obj: "InfraConfig") -> None:
+    ts = int(time.time())
+    obj.status_update_ts = ts
+    updates = obj.status_updates
+    if updates and updates[-1].status is obj.status:
+        # idempotent transition (e.g. re-set during a retry); the last entry already records it
+        return
+    updates.append(StatusUpdate(obj.status, ts))
+    if len(updates) > MAX_STATUS_UPDATES:
+        # only keep the most recent transitions so long-lived instances don't grow unbounded
+        del updates[:-MAX_STATUS_UPDATES]
 
 
 # create update_generic_hook for status
@@ -76,26 +88,24 @@ post_status_hook: UpdateGenericHook["InfraConfig"] = UpdateGenericHook(
 
 
 # called in num_pid_mpc_containers_hook
-def raise_containers_error(obj: "InfraConfig") -> None:
-    raise ValueError(
-        f"num_pid_containers must be less than or equal to num_mpc_containers. Received num_pid_containers = {obj.num_pid_containers} and num_mpc_containers = {obj.num_mpc_containers}"
-    )
-
-
-# called in num_pid_mpc_containers_hook
-def not_valid_containers(obj: "InfraConfig") -> bool:
-    if hasattr(obj, "num_pid_containers") and hasattr(obj, "num_mpc_containers"):
-        return obj.num_pid_containers > obj.num_mpc_containers
-    # one or both not initialized yet
-    return False
+# raises once both container counts are initialized and num_pid_containers > num_mpc_containers
+def validate_num_containers(obj: "InfraConfig") -> None:
+    d = obj.__dict__
+    if (
+        "num_pid_containers" in d
+        and "num_mpc_containers" in d
+        and d["num_pid_containers"] > d["num_mpc_containers"]
+    ):
+        raise ValueError(
+            f"num_pid_containers must be less than or equal to num_mpc_containers. Received num_pid_containers = {obj.num_pid_containers} and num_mpc_containers = {obj.num_mpc_containers}"
+        )
 
 
 # create generic_hook for num_pid_containers > num_mpc_containers check
-# if num_pid_containers < num_mpc_containers => raise an error
+# if num_pid_containers > num_mpc_containers => raise an error
 num_pid_mpc_containers_hook: GenericHook["InfraConfig"] = GenericHook(
-    hook_function=raise_containers_error,
+    hook_function=validate_num_containers,
     triggers=[HookEventType.POST_INIT, HookEventType.POST_UPDATE],
-    hook_condition=not_valid_containers,
 )
 
 
@@ -144,7 +154,7 @@ class InfraConfig(DataClassJsonMixin, DataclassMutabilityMixin):
     )
     num_files_per_mpc_container: int
 
-    # status_updates will be update in status hook
+    # status_updates will be update in status hook, keeping the last MAX_STATUS_UPDATES entries
     status_updates: List[StatusUpdate]
 
     tier: Optional[str] = immutable_field(default=None)
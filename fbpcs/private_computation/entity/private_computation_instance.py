@@ -8,8 +8,13 @@
 
 import os
 import time
+from collections.abc import Collection, Mapping
 from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
 from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union
+from uuid import UUID
 
 from dataclasses_json.mm import SchemaType
 
@@ -58,6 +63,26 @@ UnionedPCInstanceStatus = Union[
 ]
 
 
+class _InstanceJSONEncoder(json.JSONEncoder):
+    """Encodes the raw values schema().dump leaves in place for fields without a marshmallow type
+
+    Handles the same types as dataclasses_json's JSON encoder (collections, mappings, datetime, UUID, Enum, Decimal).
+    """
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, Mapping):
+            return dict(o)
+        if isinstance(o, Collection):
+            return list(o)
+        if isinstance(o, datetime):
+            return o.timestamp()
+        if isinstance(o, Enum):
+            return o.value
+        if isinstance(o, (UUID, Decimal)):
+            return str(o)
+        return super().default(o)
+
+
 @dataclass
 class PrivateComputationInstance(InstanceBase):
     """Stores metadata of a private computation instance
@@ -70,28 +95,30 @@ class PrivateComputationInstance(InstanceBase):
     product_config: ProductConfig
 
     def dumps_schema(self) -> str:
-        json_object = json.loads(super().dumps_schema())
+        # dump to plain dicts and encode once, rather than round tripping each part through a json string.
+        # product_config is excluded here because it is dumped with its concrete subclass schema below.
+        json_object = self.schema(exclude=("product_config",)).dump(self)
 
         # this is a helper field used in InstanceBase setter
         json_object.pop("initialized", None)
 
-        json_object["product_config"] = json.loads(
-            self.product_config.__class__.schema().dumps(self.product_config)
+        json_object["product_config"] = self.product_config.__class__.schema().dump(
+            self.product_config
         )
-        return json.dumps(json_object)
+        return json.dumps(json_object, cls=_InstanceJSONEncoder)
 
     @classmethod
     def loads_schema(cls, json_schema_str: str) -> "PrivateComputationInstance":
         json_object = json.loads(json_schema_str)
 
         # create infra config
-        infra_config: InfraConfig = InfraConfig.schema().loads(
-            json.dumps(json_object["infra_config"]), many=None
+        infra_config: InfraConfig = InfraConfig.schema().load(
+            json_object["infra_config"], many=None
         )
 
         # create product config
-        product_config: ProductConfig = cls._product_map(json_object).loads(
-            json.dumps(json_object["product_config"]), many=None
+        product_config: ProductConfig = cls._product_map(json_object).load(
+            json_object["product_config"], many=None
         )
 
         return PrivateComputationInstance(
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+import copy
+import dataclasses
+import json
+import pickle
+import time
+import unittest
+
+from fbpcs.private_computation.entity.infra_config import (
+    InfraConfig,
+    MAX_STATUS_UPDATES,
+    PrivateComputationGameType,
+    PrivateComputationRole,
+    StatusUpdate,
+)
+from fbpcs.private_computation.entity.private_computation_status import (
+    PrivateComputationInstanceStatus,
+)
+from fbpcs.private_computation.test.entity.generate_instance_json import (
+    gen_dummy_pc_instance,
+)
+
+
+class TestInfraConfig(unittest.TestCase):
+    def _create_infra_config(
+        self, num_pid_containers: int = 1, num_mpc_containers: int = 1
+    ) -> InfraConfig:
+        return InfraConfig(
+            instance_id="infra_config_instance_id",
+            role=PrivateComputationRole.PUBLISHER,
+            status=PrivateComputationInstanceStatus.CREATED,
+            status_update_ts=0,
+            instances=[],
+            game_type=PrivateComputationGameType.LIFT,
+            num_pid_containers=num_pid_containers,
+            num_mpc_containers=num_mpc_containers,
+            num_files_per_mpc_container=40,
+            status_updates=[],
+        )
+
+    def test_status_update_hook(self) -> None:
+        infra_config = self._create_infra_config()
+        self.assertEqual(infra_config.status_updates, [])
+
+        before_ts = int(time.time())
+        infra_config.status = PrivateComputationInstanceStatus.PID_SHARD_STARTED
+
+        self.assertGreaterEqual(infra_config.status_update_ts, before_ts)
+        self.assertEqual(len(infra_config.status_updates), 1)
+        self.assertEqual(
+            infra_config.status_updates[0].status,
+            PrivateComputationInstanceStatus.PID_SHARD_STARTED,
+        )
+        self.assertEqual(
+            infra_config.status_updates[0].status_update_ts,
+            infra_config.status_update_ts,
+        )
+
+    def test_status_updates_skip_repeated_status(self) -> None:
+        infra_config = self._create_infra_config()
+        infra_config.status_updates.append(
+            StatusUpdate(PrivateComputationInstanceStatus.PID_SHARD_STARTED, 0)
+        )
+
+        infra_config.status = PrivateComputationInstanceStatus.PID_SHARD_STARTED
+
+        self.assertEqual(len(infra_config.status_updates), 1)
+        self.assertGreater(infra_config.status_update_ts, 0)
+
+    def test_status_updates_are_bounded(self) -> None:
+        infra_config = self._create_infra_config()
+        statuses = [
+            PrivateComputationInstanceStatus.PID_SHARD_STARTED,
+            PrivateComputationInstanceStatus.PID_SHARD_COMPLETED,
+        ]
+        for i in range(MAX_STATUS_UPDATES + 10):
+            infra_config.status = statuses[i % 2]
+
+        self.assertEqual(len(infra_config.status_updates), MAX_STATUS_UPDATES)
+        self.assertEqual(infra_config.status_updates[-1].status, infra_config.status)
+
+    def test_num_containers_hook(self) -> None:
+        with self.assertRaises(ValueError):
+            self._create_infra_config(num_pid_containers=2, num_mpc_containers=1)
+
+        infra_config = self._create_infra_config(
+            num_pid_containers=1, num_mpc_containers=2
+        )
+        with self.assertRaises(ValueError):
+            infra_config.num_pid_containers = 3
+
+    def test_status_update_dict_round_trip(self) -> None:
+        status_update = StatusUpdate(
+            PrivateComputationInstanceStatus.PID_SHARD_STARTED, 1234
+        )
+        status_update_dict = status_update.to_dict(encode_json=True)
+
+        self.assertEqual(
+            status_update_dict,
+            {"status": "PID_SHARD_STARTED", "status_update_ts": 1234},
+        )
+        self.assertEqual(StatusUpdate.from_dict(status_update_dict), status_update)
+
+    def test_status_update_is_slotted(self) -> None:
+        status_update = StatusUpdate(
+            PrivateComputationInstanceStatus.PID_SHARD_STARTED, 1234
+        )
+
+        self.assertFalse(hasattr(status_update, "__dict__"))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            # pyre-ignore[41]: status is read-only
+            status_update.status = PrivateComputationInstanceStatus.CREATED
+        self.assertEqual(copy.deepcopy(status_update), status_update)
+        self.assertEqual(pickle.loads(pickle.dumps(status_update)), status_update)
+
+        infra_config = self._create_infra_config()
+        infra_config.status_updates.append(status_update)
+        self.assertEqual(
+            dataclasses.asdict(infra_config)["status_updates"],
+            [
+                {
+                    "status": PrivateComputationInstanceStatus.PID_SHARD_STARTED,
+                    "status_update_ts": 1234,
+                }
+            ],
+        )
+
+    def test_status_updates_serde(self) -> None:
+        infra_config = self._create_infra_config()
+        infra_config.status = PrivateComputationInstanceStatus.PID_SHARD_STARTED
+        infra_config.status = PrivateComputationInstanceStatus.PID_SHARD_COMPLETED
+
+        json_object = json.loads(InfraConfig.schema().dumps(infra_config))
+        self.assertEqual(
+            json_object["status_updates"],
+            [
+                {
+                    "status": "PID_SHARD_STARTED",
+                    "status_update_ts": infra_config.status_updates[0].status_update_ts,
+                },
+                {
+                    "status": "PID_SHARD_COMPLETED",
+                    "status_update_ts": infra_config.status_updates[1].status_update_ts,
+                },
+            ],
+        )
+
+        for deserialized in (
+            InfraConfig.schema().loads(json.dumps(json_object)),
+            InfraConfig.from_json(infra_config.to_json()),
+        ):
+            self.assertEqual(deserialized.status_updates, infra_config.status_updates)
+            self.assertIsInstance(deserialized.status_updates[0], StatusUpdate)
+
+    def test_status_updates_to_dict(self) -> None:
+        infra_config = self._create_infra_config()
+        infra_config.status = PrivateComputationInstanceStatus.PID_SHARD_STARTED
+
+        self.assertEqual(
+            infra_config.to_dict()["status_updates"],
+            [
+                {
+                    "status": PrivateComputationInstanceStatus.PID_SHARD_STARTED,
+                    "status_update_ts": infra_config.status_updates[0].status_update_ts,
+                }
+            ],
+        )
+        self.assertEqual(
+            infra_config.to_dict(encode_json=True)["status_updates"],
+            [
+                {
+                    "status": "PID_SHARD_STARTED",
+                    "status_update_ts": infra_config.status_updates[0].status_update_ts,
+                }
+            ],
+        )
+        self.assertEqual(
+            InfraConfig.from_dict(infra_config.to_dict()).status_updates,
+            infra_config.status_updates,
+        )
+
+    def test_status_updates_nested_to_dict(self) -> None:
+        # dataclasses_json encodes nested dataclasses without calling their own to_dict
+        pc_instance = gen_dummy_pc_instance()
+        pc_instance.infra_config.status = (
+            PrivateComputationInstanceStatus.PID_SHARD_STARTED
+        )
+        status_update_ts = pc_instance.infra_config.status_updates[-1].status_update_ts
+
+        infra_config_dict = pc_instance.to_dict(encode_json=True)["infra_config"]
+        self.assertEqual(
+            infra_config_dict["status_updates"][-1],
+            {"status": "PID_SHARD_STARTED", "status_update_ts": status_update_ts},
+        )
+        self.assertEqual(
+            json.loads(json.dumps(infra_config_dict["status_updates"])),
+            infra_config_dict["status_updates"],
+        )
+        self.assertEqual(
+            pc_instance.to_dict()["infra_config"]["status_updates"][-1],
+            {
+                "status": PrivateComputationInstanceStatus.PID_SHARD_STARTED,
+                "status_update_ts": status_update_ts,
+            },
+        )
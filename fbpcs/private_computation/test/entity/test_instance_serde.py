@@ -6,13 +6,22 @@
 
 # pyre-strict
 
+import json
 import unittest
+from collections import OrderedDict
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import UUID
 
 from fbpcs.common.entity.pcs_mpc_instance import PCSMPCInstance
 from fbpcs.pid.entity.pid_instance import PIDInstance
 from fbpcs.private_computation.entity.private_computation_instance import (
+    _InstanceJSONEncoder,
     PrivateComputationInstance,
 )
+from fbpcs.private_computation.entity.private_computation_status import (
+    PrivateComputationInstanceStatus,
+)
 from fbpcs.private_computation.test.entity.generate_instance_json import (
     gen_dummy_mpc_instance,
     gen_dummy_pc_instance,
@@ -93,3 +102,32 @@ class TestInstanceSerde(unittest.TestCase):
         # this tests that new fields can be serialized
         pc_instance = gen_dummy_pc_instance()
         pc_instance.dumps_schema()
+
+    def test_pc_json_encoder(self) -> None:
+        # dumps_schema relies on this for values without a marshmallow type
+        uuid = UUID("12345678-1234-5678-1234-567812345678")
+        value = {
+            "set": {1},
+            "frozenset": frozenset({"a"}),
+            "tuple": (1, 2),
+            "mapping": OrderedDict([("k", "v")]),
+            "datetime": datetime(2022, 1, 1, tzinfo=timezone.utc),
+            "uuid": uuid,
+            "enum": PrivateComputationInstanceStatus.CREATED,
+            "decimal": Decimal("1.5"),
+        }
+        self.assertEqual(
+            json.loads(json.dumps(value, cls=_InstanceJSONEncoder)),
+            {
+                "set": [1],
+                "frozenset": ["a"],
+                "tuple": [1, 2],
+                "mapping": {"k": "v"},
+                "datetime": 1640995200.0,
+                "uuid": str(uuid),
+                "enum": "CREATED",
+                "decimal": "1.5",
+            },
+        )
+        with self.assertRaises(TypeError):
+            json.dumps(object(), cls=_InstanceJSONEncoder)
@@ -12,6 +12,7 @@ from fbpcs.private_computation.entity.product_config import (
     CommonProductConfig,
     LiftConfig,
     ProductConfig,
+    ResultVisibility,
 )
 
 
@@ -39,3 +40,34 @@ class TestProductConfig(unittest.TestCase):
             aggregation_type=AggregationType.MEASUREMENT,
         )
         self.assertIsInstance(product_Config, AttributionConfig)
+
+    def test_enum_deserialization(self) -> None:
+        product_config = AttributionConfig(
+            common=CommonProductConfig(
+                input_path="456",
+                output_dir="789",
+                result_visibility=ResultVisibility.PARTNER,
+            ),
+            attribution_rule=AttributionRule.LAST_TOUCH_28D,
+            aggregation_type=AggregationType.MEASUREMENT,
+        )
+
+        # enum values round trip through both the dataclasses_json and marshmallow schema paths
+        self.assertEqual(
+            AttributionConfig.from_json(product_config.to_json()), product_config
+        )
+        self.assertEqual(
+            AttributionConfig.schema().loads(
+                AttributionConfig.schema().dumps(product_config)
+            ),
+            product_config,
+        )
+
+        with self.assertRaises(ValueError):
+            AttributionConfig.from_dict(
+                {
+                    "common": {"input_path": "456", "output_dir": "789"},
+                    "aggregation_type": "measurement",
+                    "attribution_rule": "last_click_0d",
+                }
+            )